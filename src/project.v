@@ -107,7 +107,11 @@ module game_timer(
     input  wire       start_btn,   // pb0
     output reg        game_end
 );
+    // The countdown toggles every cycle and would dominate any Verilator
+    // waveform dump, so it is left out of traces.
+    /* verilator tracing_off */
     reg [24:0] count;
+    /* verilator tracing_on */
     reg        prev_start;
 
     `ifdef SIMULATION
@@ -166,8 +170,10 @@ module game_fsm(
     reg prev_start;
     wire start_edge = start_btn && !prev_start;
 
-    // 1-second lockout counter
+    // 1-second lockout counter (not traced by Verilator, see game_timer)
+    /* verilator tracing_off */
     reg [19:0] lock_timer;
+    /* verilator tracing_on */
     `ifdef SIMULATION
         localparam LOCK_CYCLES = 20'd10;
     `else
@@ -4,13 +4,21 @@
 // Cocotb-driven testbench for tt_um_whack_a_mole
 module tb();
 
-  // Waveform dump
+  // Waveform dump, only when built with `make DUMP_WAVES=1`
+`ifdef DUMP_WAVES
   initial begin
+`ifdef VERILATOR
+    $dumpfile("tb.fst");
+`else
     $dumpfile("tb.vcd");
+`endif
     $dumpvars(0, tb);
   end
+`endif
 
   // Clock: 1 MHz (1000ns period)
+  // Generated here rather than by a cocotb Clock so that plain clock edges
+  // never have to round-trip through Python; the tests only await them.
   reg clk = 0;
   initial forever begin
     #500 clk = ~clk;  // Half period = 500ns
@@ -27,6 +35,10 @@ module tb();
   wire [7:0] uio_out;        // IOs: Output path (score LEDs)
   wire [7:0] uio_oe;         // IOs: Enable path
 
+  // dp (uo_out[7]) drops when the game ends. Exposed as its own signal so
+  // cocotb can wait on its edge instead of polling uo_out every cycle.
+  wire game_end = ~uo_out[7];
+
   // Instantiate the tt_um_whack_a_mole
   tt_um_whack_a_mole dut (
     .ui_in      (ui_in),